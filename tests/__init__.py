@@ -1,4 +1,3 @@
 import sys
 sys.path.append("..")
-from uav_collision_avoidance.main import *
 from uav_collision_avoidance.src.simulation.simulation import Simulation, SimulationSettings
@@ -0,0 +1,11 @@
+"""Shared test fixtures"""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Creates application instance shared by the whole test session"""
+    app = QApplication.instance() or QApplication([])
+    yield app
+    QApplication.shutdown(app)
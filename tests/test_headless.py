@@ -1,46 +1,58 @@
-import sys
 import pytest
-from PySide6.QtWidgets import QApplication
-from main import *
+import pandas as pd
+from uav_collision_avoidance.main import main
 from . import Simulation, SimulationSettings
+from uav_collision_avoidance.src.simulation.simulation_data import SimulationData
 
 def test_headless():
         with pytest.raises(SystemExit) as e:
             main("headless")
         assert e.value.code == 0
 
+def test_package_main_is_callable():
+    """Package main stays the entry point function after main submodule import"""
+    import uav_collision_avoidance.main
+    import uav_collision_avoidance
+    assert callable(uav_collision_avoidance.main)
+    from uav_collision_avoidance import main as package_main
+    assert callable(package_main)
+
 test_path : str = "data/simulation-2024-06-08-15-52-45.csv"
 lowest_frequency_tested : int = 10
 highest_frequency_tested : int = 100
+frequencies_tested : list = list(range(lowest_frequency_tested, highest_frequency_tested + 1, 10))
+
+def run_baseline(csv_data : pd.DataFrame, simulation_frequency : float, test_id : int = 0) -> SimulationData:
+    """Runs simulation without collision avoidance for given frequency and test"""
+    SimulationSettings.reset()
+    SimulationSettings.set_simulation_frequency(simulation_frequency)
+    sim = Simulation(headless = True)
+    assert sim.load_simulation_data_from_memory(csv_data, test_id = test_id, avoid_collisions = False)
+    return sim.run_headless(avoid_collisions = False)
 
-@pytest.fixture
-def tester(request):
-    """Creates headless testing object"""
-    return TestHeadless(request.param)
+@pytest.fixture(scope="module")
+def csv_data():
+    """Reads tested simulation data file"""
+    return Simulation.read_simulation_data_file(test_path)
 
-class Test:
-    @pytest.mark.parametrize("tester", list(range(lowest_frequency_tested, highest_frequency_tested + 1, 10)), indirect=["tester"])
-    def test_tc1(self, tester):
-       tester.test_headless_load()
+def test_sweep(qapp, csv_data):
+    """Runs headless simulation for all tested frequencies within single test"""
+    for simulation_frequency in frequencies_tested:
+        TestHeadless(simulation_frequency, csv_data).test_headless_load()
 
 class TestHeadless:
     """Test headless simulation"""
-    def __init__(self, simulation_frequency : float):
+    def __init__(self, simulation_frequency : float, csv_data : pd.DataFrame):
         self.simulation_frequency = simulation_frequency
+        self.csv_data = csv_data
 
     def test_headless_load(self):
-        with pytest.raises(SystemExit) as e:
-            app = QApplication.instance()
-            if app:
-                app.quit()
-            app = QApplication()
-            SimulationSettings.__init__()
-            SimulationSettings.set_simulation_frequency(self.simulation_frequency)
-            sim = Simulation(headless = True)
-            assert sim.load_simulation_data_from_file(test_path, test_id = 0, avoid_collisions = False)
-            sim.run_headless(avoid_collisions = False)
-            assert sim.load_simulation_data_from_file(test_path, test_id = 0, avoid_collisions = True)
-            sim.run_headless(avoid_collisions = True)
-            QApplication.shutdown(app)
-            sys.exit(0)
-        assert e.value.code == 0
+        baseline : SimulationData = run_baseline(self.csv_data, self.simulation_frequency)
+        SimulationSettings.reset()
+        SimulationSettings.set_simulation_frequency(self.simulation_frequency)
+        sim = Simulation(headless = True)
+        assert sim.load_simulation_data_from_memory(self.csv_data, test_id = 0, avoid_collisions = True)
+        avoidance : SimulationData = sim.run_headless(avoid_collisions = True)
+        assert baseline.collision
+        assert not avoidance.collision
+        assert avoidance.minimal_relative_distance > baseline.minimal_relative_distance
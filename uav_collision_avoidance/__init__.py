@@ -2,3 +2,5 @@
 
 from .main import main
 from .version import __version__ as version
+
+__all__ = ("main", "version")
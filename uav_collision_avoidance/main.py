@@ -1,176 +1,285 @@
 """Main module for UAV Collision Avoidance application"""
 
+import sys
+import time
 import signal
 import logging
 import platform
-import datetime
+import functools
 import multiprocessing
+import logging.handlers
 from pathlib import Path
-from screeninfo import get_monitors
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 
-from PySide6.QtWidgets import QApplication
 from .version import __version__ as version
-from .src.simulation.simulation import Simulation, SimulationSettings
-
-try:
-    start_time = datetime.datetime.now().strftime("%Y-%m-%d")
-    Path("logs").mkdir(parents=True, exist_ok=True)
-    logging.basicConfig(
-        filename=f"logs/simulation-{start_time}.log",
-        level=logging.DEBUG,
-        format="%(asctime)s - %(levelname)s - %(filename)s - %(message)s")
-except:
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(levelname)s - %(filename)s - %(message)s",
-        handlers=[logging.StreamHandler()])
-    
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QSize
+    from PySide6.QtWidgets import QApplication
+
+app_name : str = "UAV Collision Avoidance"
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler writing records through large buffer, flushing on errors and close"""
+
+    def __init__(self, filename : str, buffer_size : int = 65536) -> None:
+        self.__buffer_size : int = buffer_size
+        super().__init__(filename)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.__buffer_size, encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record : logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+logging_configured : bool = False
+
+def _configure_logging() -> None:
+    """Configures logging handlers once per process"""
+    global logging_configured
+    if logging_configured:
+        return
+    logging_configured = True
+    try:
+        start_time = time.strftime("%Y-%m-%d")
+        Path("logs").mkdir(parents=True, exist_ok=True)
+        file_handler = BufferedFileHandler(f"logs/simulation-{start_time}.log")
+        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(filename)s - %(message)s"))
+        logging.basicConfig(
+            level=logging.DEBUG,
+            handlers=[logging.handlers.MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)])
+    except OSError:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s - %(levelname)s - %(filename)s - %(message)s",
+            handlers=[logging.StreamHandler()])
+    logging.info("-" * 120)
+    logging.info("Detected platform: %s", platform.system())
+
 def signal_handler(sig, frame) -> None:
     logging.warning("Ctrl+C keyboard interrupt. Exiting...")
     try:
         signal.default_int_handler(sig, frame)
     except KeyboardInterrupt:
-        import sys
         sys.exit(1)
-signal.signal(signal.SIGINT, signal_handler)
 
-logging.info("-" * 120)
-if platform.system() == "Windows":
-    import ctypes
-    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
-        f"io.github.mldxo.uav-collision-avoidance.{version}")
-logging.info("Detected platform: %s", platform.system())
+app_id_set : bool = False
+
+def _set_app_id() -> None:
+    """Sets Windows application user model id once per process"""
+    global app_id_set
+    if app_id_set:
+        return
+    app_id_set = True
+    if sys.platform == "win32":
+        import ctypes
+        set_app_user_model_id = ctypes.WinDLL("shell32").SetCurrentProcessExplicitAppUserModelID
+        set_app_user_model_id.argtypes = [ctypes.c_wchar_p]
+        set_app_user_model_id(f"io.github.mldxo.uav-collision-avoidance.{version}")
+
+def init_simulation_worker() -> None:
+    """Prepares worker process once for all simulation tests it runs"""
+    from PySide6.QtWidgets import QApplication
+    if QApplication.instance() is None:
+        QApplication([])
+    logging.disable()
 
 def run_simulation_tests(test_number : int) -> None:
+    from .src.simulation.simulation import Simulation
     sim : Simulation = Simulation(headless = True, tests = True)
     if test_number > 0:
         sim.run_tests(test_number)
     else:
         sim.run()
 
-def main(arg = None) -> None:
-    """Executes main function"""
-    import sys
-    args = sys.argv[1:]
-    app = QApplication(args)
-    app.setApplicationName("UAV Collision Avoidance")
+truthy_values : frozenset = frozenset({"true", "t", "yes", "1"})
+usage : str = "Usage: uav_collision_avoidance [realtime|headless|tests|load|ongoing|help|version]"
+help_messages : Dict[str, Tuple[str, str]] = {
+    "realtime": (
+        "Usage: uav_collision_avoidance realtime [file_path] [test_index] [collision_avoidance]",
+        "Description: Runs the simulation in real-time with GUI"),
+    "headless": (
+        "Usage: uav_collision_avoidance headless",
+        "Description: Runs the simulation in headless mode without GUI"),
+    "tests": (
+        "Usage: uav_collision_avoidance tests [test_number]",
+        "Description: Runs the simulation multiple times in headless mode without GUI defaulting to 10 times"),
+    "load": (
+        "Usage: uav_collision_avoidance load [file_path] [test_index]",
+        "Description: Loads a simulation data file and runs the simulation in headless mode without GUI, defaults to example data file"),
+    "ongoing": (
+        "Usage: uav_collision_avoidance ongoing",
+        "Description: Runs the simulation tests indefinitely"),
+    "help": (
+        "Usage: uav_collision_avoidance help [app_argument]",
+        "Description: Displays help information for the specified app argument"),
+}
+
+@functools.cache
+def primary_screen_size() -> "QSize | None":
+    """Returns primary screen size, probed once per process"""
+    from PySide6.QtGui import QGuiApplication
+    if QGuiApplication.instance() is None or QGuiApplication.primaryScreen() is None:
+        return None
+    return QGuiApplication.primaryScreen().size()
+
+def create_application(args : List[str], headless : bool = False) -> Tuple["QApplication", bool]:
+    """Creates application or reuses existing one, returns it with ownership flag"""
+    from PySide6.QtWidgets import QApplication
+    from .src.simulation.simulation_settings import SimulationSettings
+    app = QApplication.instance()
+    owns_app : bool = app is None
+    if owns_app:
+        app = QApplication(args)
+    app.setApplicationName(app_name)
     app.setApplicationVersion(version)
-    SimulationSettings.screen_resolution = app.primaryScreen().size()
+    if not headless:
+        SimulationSettings.screen_resolution = primary_screen_size()
     logging.info("%s %s", app.applicationName(), app.applicationVersion())
-    sim : Simulation | None = None
-    if len(args) > 0 or arg is not None:
-        if args[0] == "realtime" or args[0] == "default" or args[0] == "gui":
-            if len(get_monitors()) == 0:
-                logging.warning("Launching GUI Application without monitors detected")
-            sim = Simulation()
-            if len(args) >= 2:
-                file_path : str = args[1]
-                test_id : int = 0
-                avoid_collisions : bool = False
-                if len(args) >= 3:
-                    test_id = int(args[2])
-                if len(args) >= 4:
-                    avoidance : str = str(args[3])
-                    if avoidance == "true" or avoidance == "True" or avoidance == "t" or avoidance == "T" or avoidance == "yes" or avoidance == "1":
-                        avoid_collisions = True
-                if len(args) >= 5:
-                    print(f"Invalid arguments: {args}")
-                    logging.warning("Invalid arguments: %s", args)
-                sim.load_simulation_data_from_file(file_path = file_path, test_id = test_id, avoid_collisions = avoid_collisions)
-                sim.run_gui(avoid_collisions = avoid_collisions, load_latest_data_file = False)
-            else:
-                sim.run()
-            sys.exit(app.exec())
-        elif args[0] == "headless" or arg == "headless":
-            sim = Simulation(headless = True)
-            sim.run()
-            QApplication.shutdown(app)
-            sys.exit(0)
-        elif args[0] == "tests" or arg == "tests":
-            sim = Simulation(headless = True, tests = True)
-            if len(args) > 1 and int(args[1]) > 0:
-                sim.run_tests(test_number = int(args[1]))
-            else:
-                sim.run()
-            QApplication.shutdown(app)
-            sys.exit(0)
-        elif args[0] == "load":
-            file_path : str = "data/simulation-2024-06-08-15-52-45.csv"
-            test_id : int = 0
-            if len(args) >= 2:
-                file_path = args[1]
-                if len(args) == 3:
-                    test_id = int(args[2])
-                if len(args) >= 4:
-                    print(f"Invalid arguments: {args}")
-                    logging.warning("Invalid arguments: %s", args)
-            sim = Simulation(headless = True)
-            assert sim.load_simulation_data_from_file(file_path = file_path, test_id = test_id, avoid_collisions = False)
-            sim.run_headless(avoid_collisions = False)
-            assert sim.load_simulation_data_from_file(file_path = file_path, test_id = test_id, avoid_collisions = True)
-            sim.run_headless(avoid_collisions = True)
-            QApplication.shutdown(app)
-            sys.exit(0)
-        elif args[0] == "ongoing":
-            processes = []
-            concurrent_tests = multiprocessing.cpu_count()
-            logging.info("Running %d concurrent tests", concurrent_tests)
-            logging.warning("Disabling logging because due to log storm")
-            logging.disable()
-            for i in range(concurrent_tests):
-                process = multiprocessing.Process(target=run_simulation_tests, args=(i,))
-                process.start()
-                processes.append(process)
-            for process in processes:
-                process.join()
-        elif args[0] == "help" and len(args) > 1:
-            if args[1] == "realtime":
-                print("Usage: uav_collision_avoidance realtime [file_path] [test_index] [collision_avoidance]")
-                print("Description: Runs the simulation in real-time with GUI")
-                sys.exit(0)
-            elif args[1] == "headless":
-                print("Usage: uav_collision_avoidance headless")
-                print("Description: Runs the simulation in headless mode without GUI")
-                sys.exit(0)
-            elif args[1] == "tests":
-                print("Usage: uav_collision_avoidance tests [test_number]")
-                print("Description: Runs the simulation multiple times in headless mode without GUI defaulting to 10 times")
-                sys.exit(0)
-            elif args[1] == "load":
-                print("Usage: uav_collision_avoidance load [file_path] [test_index]")
-                print("Description: Loads a simulation data file and runs the simulation in headless mode without GUI, defaults to example data file")
-                sys.exit(0)
-            elif args[1] == "ongoing":
-                print("Usage: uav_collision_avoidance ongoing")
-                print("Description: Runs the simulation tests indefinitely")
-                sys.exit(0)
-            elif args[1] == "help":
-                print("Usage: uav_collision_avoidance help [app_argument]")
-                print("Description: Displays help information for the specified app argument")
-                sys.exit(0)
-            else:
-                print(f"Invalid argument: {args[1]}")
-                logging.error("Invalid argument: %s", args[1])
-                sys.exit(1)
-        elif args[0] == "help":
-            print("Usage: uav_collision_avoidance [realtime|headless|tests|load|ongoing|help|version]")
-            sys.exit(0)
-        elif args[0] == "version":
-            print(f"{app.applicationName()} {app.applicationVersion()}")
-            sys.exit(0)
-        elif len(args) > 1:
+    return app, owns_app
+
+def shutdown_application(app : "QApplication", owns_app : bool) -> None:
+    """Shuts down application if it was created by the command"""
+    from PySide6.QtWidgets import QApplication
+    if owns_app:
+        QApplication.shutdown(app)
+
+def _cmd_help(args : List[str]) -> int:
+    """Displays general or argument specific help"""
+    if len(args) < 2:
+        print(usage)
+        return 0
+    if args[1] not in help_messages:
+        print(f"Invalid argument: {args[1]}")
+        logging.error("Invalid argument: %s", args[1])
+        return 1
+    print("\n".join(help_messages[args[1]]))
+    return 0
+
+def _cmd_version(args : List[str]) -> int:
+    """Displays application version"""
+    print(f"{app_name} {version}")
+    return 0
+
+def _cmd_realtime(args : List[str]) -> int:
+    """Runs the simulation in real-time with GUI"""
+    app, _ = create_application(args)
+    app.processEvents()
+    from screeninfo import get_monitors
+    from .src.simulation.simulation import Simulation
+    if len(get_monitors()) == 0:
+        logging.warning("Launching GUI Application without monitors detected")
+    sim = Simulation()
+    if len(args) >= 2:
+        file_path : str = args[1]
+        test_id : int = 0
+        avoid_collisions : bool = False
+        if len(args) >= 3:
+            test_id = int(args[2])
+        if len(args) >= 4:
+            avoid_collisions = str(args[3]).lower() in truthy_values
+        if len(args) >= 5:
             print(f"Invalid arguments: {args}")
-            logging.error("Invalid arguments: %s", args)
-            sys.exit(1)
-        else:
-            print(f"Invalid argument: {args[0]}")
-            print("Usage: uav_collision_avoidance [realtime|headless|tests|load|ongoing|help|version]")
-            logging.error("Invalid argument: %s", args[0])
-            sys.exit(1)
+            logging.warning("Invalid arguments: %s", args)
+        sim.load_simulation_data_from_file(file_path = file_path, test_id = test_id, avoid_collisions = avoid_collisions)
+        sim.run_gui(avoid_collisions = avoid_collisions, load_latest_data_file = False)
+    else:
+        sim.run()
+    return app.exec()
+
+def _cmd_headless(args : List[str]) -> int:
+    """Runs the simulation in headless mode"""
+    from .src.simulation.simulation import Simulation
+    app, owns_app = create_application(args, headless = True)
+    sim = Simulation(headless = True)
+    sim.run()
+    shutdown_application(app, owns_app)
+    return 0
+
+def _cmd_tests(args : List[str]) -> int:
+    """Runs the simulation tests in headless mode"""
+    from .src.simulation.simulation import Simulation
+    app, owns_app = create_application(args, headless = True)
+    sim = Simulation(headless = True, tests = True)
+    if len(args) > 1 and int(args[1]) > 0:
+        sim.run_tests(test_number = int(args[1]))
     else:
-        sim = Simulation()
         sim.run()
-    sys.exit(app.exec())
+    shutdown_application(app, owns_app)
+    return 0
+
+def _cmd_load(args : List[str]) -> int:
+    """Loads simulation data file and runs it with and without collision avoidance"""
+    from .src.simulation.simulation import Simulation
+    file_path : str = "data/simulation-2024-06-08-15-52-45.csv"
+    test_id : int = 0
+    if len(args) >= 2:
+        file_path = args[1]
+        if len(args) == 3:
+            test_id = int(args[2])
+        if len(args) >= 4:
+            print(f"Invalid arguments: {args}")
+            logging.warning("Invalid arguments: %s", args)
+    app, owns_app = create_application(args, headless = True)
+    sim = Simulation(headless = True)
+    assert sim.load_simulation_data_from_file(file_path = file_path, test_id = test_id, avoid_collisions = False)
+    sim.run_headless(avoid_collisions = False)
+    assert sim.load_simulation_data_from_file(file_path = file_path, test_id = test_id, avoid_collisions = True)
+    sim.run_headless(avoid_collisions = True)
+    shutdown_application(app, owns_app)
+    return 0
+
+def _cmd_ongoing(args : List[str]) -> int:
+    """Runs the simulation tests indefinitely in concurrent processes"""
+    app, _ = create_application(args, headless = True)
+    concurrent_tests = multiprocessing.cpu_count()
+    logging.info("Running %d concurrent tests", concurrent_tests)
+    logging.warning("Disabling logging because due to log storm")
+    logging.disable()
+    with multiprocessing.Pool(concurrent_tests, initializer = init_simulation_worker) as pool:
+        for _ in pool.imap_unordered(run_simulation_tests, range(concurrent_tests)):
+            pass
+    return app.exec()
+
+def _cmd_invalid(args : List[str]) -> int:
+    """Reports invalid arguments"""
+    if len(args) > 1:
+        print(f"Invalid arguments: {args}")
+        logging.error("Invalid arguments: %s", args)
+    else:
+        print(f"Invalid argument: {args[0]}")
+        print(usage)
+        logging.error("Invalid argument: %s", args[0])
+    return 1
+
+_DISPATCH : Dict[str, Callable[[List[str]], int]] = {
+    "help": _cmd_help,
+    "version": _cmd_version,
+    "realtime": _cmd_realtime,
+    "default": _cmd_realtime,
+    "gui": _cmd_realtime,
+    "headless": _cmd_headless,
+    "tests": _cmd_tests,
+    "load": _cmd_load,
+    "ongoing": _cmd_ongoing,
+}
+
+def main(arg = None) -> None:
+    """Executes main function"""
+    _configure_logging()
+    _set_app_id()
+    signal.signal(signal.SIGINT, signal_handler)
+    args = sys.argv[1:] if arg is None else [arg]
+    if len(args) == 0:
+        sys.exit(_cmd_realtime(args))
+    sys.exit(_DISPATCH.get(args[0], _cmd_invalid)(args))
 
 if __name__ == "__main__":
     main()
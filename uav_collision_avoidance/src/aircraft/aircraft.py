@@ -25,42 +25,37 @@ class Aircraft(QObject):
     @property
     def vehicle(self) -> AircraftVehicle:
         """Returns aircraft vehicle"""
-        with QMutexLocker(self.__mutex):
-            return self.__vehicle
+        return self.__vehicle
     
     @property
     def fcc(self) -> AircraftFCC:
         """Returns aircraft fcc"""
-        with QMutexLocker(self.__mutex):
-            return self.__fcc
+        return self.__fcc
     
     @property
     def initial_position(self) -> QVector3D:
         """Returns initial position"""
-        with QMutexLocker(self.__mutex):
-            return self.__initial_position
+        return self.__initial_position
         
     @property
     def initial_target(self) -> QVector3D:
         """Returns initial target"""
-        with QMutexLocker(self.__mutex):
-            return self.__initial_target
+        return self.__initial_target
     
     @property
     def initial_speed(self) -> QVector3D:
         """Returns initial speed"""
-        with QMutexLocker(self.__mutex):
-            return self.__initial_speed
+        return self.__initial_speed
         
     @property
     def initial_roll_angle(self) -> float:
         """Returns initial roll angle"""
-        with QMutexLocker(self.__mutex):
-            return self.__initial_roll_angle
+        return self.__initial_roll_angle
 
     def reset(self) -> None:
         """Resets the aircraft to initial state"""
-        self.__vehicle.speed = copy(self.initial_speed)
-        self.__vehicle.position = copy(self.initial_position)
-        self.__vehicle.roll_angle = copy(self.initial_roll_angle)
-        self.__vehicle.reset_distance_covered()
+        with QMutexLocker(self.__mutex):
+            self.__vehicle.speed = copy(self.__initial_speed)
+            self.__vehicle.position = copy(self.__initial_position)
+            self.__vehicle.roll_angle = self.__initial_roll_angle
+            self.__vehicle.reset_distance_covered()
@@ -2,15 +2,15 @@
 
 import random
 import logging
-from copy import copy
-from typing import List
+from typing import List, Tuple
 from collections import deque
-from math import dist, tan, atan2, degrees, radians
+from math import hypot, tan, atan2, degrees, radians
 
 from PySide6.QtCore import QObject, QMutex, QMutexLocker
 from PySide6.QtGui import QVector3D
 
 from .aircraft_vehicle import AircraftVehicle
+from .aircraft_math import normalize_angle, format_yaw_angle, yaw_angle_towards, pitch_angle_towards, yaw_difference, roll_angle_for_yaw_difference, YAW_DEAD_BAND, HEAD_ON_MISS_DISTANCE
 
 class AircraftFCC(QObject):
     """Aircraft Flight Control Computer"""
@@ -20,9 +20,10 @@ class AircraftFCC(QObject):
         self.__mutex : QMutex = QMutex()
         self.__aircraft_id = aircraft_id
         self.__aircraft = aircraft
+        self.__arrival_distance_squared : float = (aircraft.size * 5) ** 2 # [x] Tmp set to 5 instead of size / 2
         self.__destinations : deque[QVector3D] = deque()
-        self.__destinations_history : List[QVector3D] = []
-        self.__visited : List[QVector3D] = []
+        self.__destinations_history : deque[QVector3D] = deque(maxlen = 256)
+        self.__visited : List[Tuple[float, float, float]] = []
         self.__autopilot : bool = True
         self.__ignore_destinations : bool = False
         self.__initial_target : QVector3D | None = initial_target
@@ -41,42 +42,37 @@ class AircraftFCC(QObject):
         self.__safe_zone_occupied : bool = False
         self.__evade_maneuver : bool = False
         self.__vector_sharing_resolution : QVector3D | None = None
+        self.__lookahead : Tuple[QVector3D, QVector3D, float] | None = None
 
     @property
     def aircraft_id(self) -> int:
         """Returns aircraft id"""
-        with QMutexLocker(self.__mutex):
-            return self.__aircraft_id
+        return self.__aircraft_id
     
     @property
     def aircraft(self) -> AircraftVehicle:
         """Returns aircraft vehicle"""
-        with QMutexLocker(self.__mutex):
-            return self.__aircraft
+        return self.__aircraft
     
     @property
     def destinations(self) -> deque[QVector3D]:
         """Returns destinations list"""
-        with QMutexLocker(self.__mutex):
-            return self.__destinations
+        return self.__destinations
     
     @property
-    def destinations_history(self) -> List[QVector3D]:
-        """Returns destinations history list"""
-        with QMutexLocker(self.__mutex):
-            return self.__destinations_history
+    def destinations_history(self) -> deque[QVector3D]:
+        """Returns most recent visited destinations"""
+        return self.__destinations_history
     
     @property
-    def visited(self) -> List[QVector3D]:
-        """Returns visited list"""
-        with QMutexLocker(self.__mutex):
-            return self.__visited
+    def visited(self) -> List[Tuple[float, float, float]]:
+        """Returns visited list of (x, y, z) coordinates"""
+        return self.__visited
     
     @property
     def autopilot(self) -> bool:
         """Returns autopilot state"""
-        with QMutexLocker(self.__mutex):
-            return self.__autopilot
+        return self.__autopilot
     
     def toggle_autopilot(self) -> None:
         """Toggles autopilot state"""
@@ -86,69 +82,58 @@ class AircraftFCC(QObject):
     @property
     def ignore_destinations(self) -> bool:
         """Returns ignore destinations state"""
-        with QMutexLocker(self.__mutex):
-            return self.__ignore_destinations
+        return self.__ignore_destinations
     
     @ignore_destinations.setter
     def ignore_destinations(self, value : bool) -> None:
         """Sets ignore destinations state"""
-        with QMutexLocker(self.__mutex):
-            self.__ignore_destinations = value
+        self.__ignore_destinations = value
 
     @property
     def initial_target(self) -> QVector3D | None:
         """Returns initial target"""
-        with QMutexLocker(self.__mutex):
-            return self.__initial_target
+        return self.__initial_target
 
     @property
     def target_yaw_angle(self) -> float:
         """Returns target yaw angle"""
-        with QMutexLocker(self.__mutex):
-            return self.__target_yaw_angle
+        return self.__target_yaw_angle
     
     @target_yaw_angle.setter
     def target_yaw_angle(self, angle : float) -> None:
         """Sets target yaw angle"""
-        with QMutexLocker(self.__mutex):
-            self.__target_yaw_angle = angle
+        self.__target_yaw_angle = angle
 
     @property
     def target_roll_angle(self) -> float:
         """Returns target roll angle"""
-        with QMutexLocker(self.__mutex):
-            return self.__target_roll_angle
+        return self.__target_roll_angle
     
     @target_roll_angle.setter
     def target_roll_angle(self, angle : float) -> None:
         """Sets target roll angle"""
-        with QMutexLocker(self.__mutex):
-            self.__target_roll_angle = angle
+        self.__target_roll_angle = angle
 
     @property
     def target_pitch_angle(self) -> float:
         """Returns target pitch angle"""
-        with QMutexLocker(self.__mutex):
-            return self.__target_pitch_angle
+        return self.__target_pitch_angle
     
     @target_pitch_angle.setter
     def target_pitch_angle(self, angle : float) -> None:
         """Sets target pitch angle"""
-        with QMutexLocker(self.__mutex):
-            self.__target_pitch_angle = angle
+        self.__target_pitch_angle = angle
     
     @property
     def target_speed(self) -> float:
         """Returns target speed"""
-        with QMutexLocker(self.__mutex):
-            return self.__target_speed
+        return self.__target_speed
     
     @target_speed.setter
     def target_speed(self, speed : float) -> None:
         """Sets target speed"""
         if speed > 0:
-            with QMutexLocker(self.__mutex):
-                self.__target_speed = speed
+            self.__target_speed = speed
 
     def accelerate(self, acceleration : float) -> None:
         """Accelerates aircraft's targeted speed"""
@@ -160,68 +145,55 @@ class AircraftFCC(QObject):
     @property
     def is_turning_right(self) -> bool:
         """Returns turning right state"""
-        with QMutexLocker(self.__mutex):
-            return self.__is_turning_right
+        return self.__is_turning_right
     
     @is_turning_right.setter
     def is_turning_right(self, value : bool) -> None:
         """Sets turning right state"""
-        with QMutexLocker(self.__mutex):
-            self.__is_turning_right = value
+        self.__is_turning_right = value
 
     @property
     def is_turning_left(self) -> bool:
         """Returns turning left state"""
-        with QMutexLocker(self.__mutex):
-            return self.__is_turning_left
+        return self.__is_turning_left
     
     @is_turning_left.setter
     def is_turning_left(self, value : bool) -> None:
         """Sets turning left state"""
-        with QMutexLocker(self.__mutex):
-            self.__is_turning_left = value
+        self.__is_turning_left = value
 
     def check_new_destination(self, destination : QVector3D, first : bool) -> QVector3D | None:
         """Checks if the given destination is already in the destinations list"""
-        if not all(isinstance(coord, (int, float)) for coord in (destination.x(), destination.y(), destination.z())):
-            raise TypeError("Destination coordinates must be int or float.")
-        if len(self.destinations) > 0 and first:
-            if dist(destination.toTuple(), self.destinations[0].toTuple()) < 1.0:
-                print("Attempted to stack same destination")
-                logging.warning("Attempted to stack the same destination: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
-                return None
-        elif len(self.destinations) > 0 and not first:
-            if dist(destination.toTuple(), self.destinations[len(self.destinations) - 1].toTuple()) < 1.0:
-                print("Attempted to stack same destination")
+        destinations : deque[QVector3D] = self.destinations
+        if destinations:
+            neighbour : QVector3D = destinations[0] if first else destinations[-1]
+            dx : float = destination.x() - neighbour.x()
+            dy : float = destination.y() - neighbour.y()
+            dz : float = destination.z() - neighbour.z()
+            if dx * dx + dy * dy + dz * dz < 1.0:
                 logging.warning("Attempted to stack the same destination: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
                 return None
-        if self.aircraft.position.distanceToPoint(destination) < self.aircraft.size:
-            print("Attempted to set current position as destination")
+        if self.squared_distance_to(destination) < self.aircraft.size ** 2:
             logging.warning("Attempted to set current position as destination: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
             return None
         if destination.z() < 800:
             if destination.z() < 0:
-                print("Attempted to set destination below ground")
                 logging.warning("Attempted to set destination below ground: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
             else:
-                print("Attempted to set destination too low")
                 logging.warning("Attempted to set destination too low: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
             destination = QVector3D(destination.x(), destination.y(), 800)
         elif destination.z() > 8000:
-            print("Attempted to set destination too high")
             logging.warning("Attempted to set destination too high: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
             destination = QVector3D(destination.x(), destination.y(), 8000)
         height_difference = abs(destination.z() - self.aircraft.position.z())
-        distance_to_destination = dist(destination.toTuple(), self.aircraft.position.toTuple())
+        distance_to_destination = self.distance_to(destination)
         min_pitch_angle = abs(degrees(atan2(height_difference, distance_to_destination)))
         if destination.z() > self.aircraft.position.z() and min_pitch_angle > 25:
-            print("Attempted to set destination with too steep climb angle")
             logging.warning("Attempted to set destination too steep climb angle: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
             max_height_difference = distance_to_destination * tan(radians(15))
             assert self.aircraft.position.z() + max_height_difference <= 8000
             destination = QVector3D(destination.x(), destination.y(), self.aircraft.position.z() + max_height_difference)
         elif destination.z() < self.aircraft.position.z() and min_pitch_angle > 25:
-            print("Attempted to set destination with too steep descent angle")
             logging.warning("Attempted to set destination too steep descent angle: (%s, %s, %s)", destination.x(), destination.y(), destination.z())
             max_height_difference = distance_to_destination * tan(radians(15))
             assert self.aircraft.position.z() - max_height_difference >= 800
@@ -255,85 +227,91 @@ class AircraftFCC(QObject):
 
     def append_visited(self) -> None:
         """Appends current location to visited list"""
-        self.visited.append(copy(self.aircraft.position))
+        self.visited.append(self.aircraft.position.toTuple())
 
     def normalize_angle(self, angle : float) -> float:
         """Normalizes -180-180 angle into 360 domain"""
-        angle = angle % 360
-        return angle if angle >= 0 else angle + 360
+        return normalize_angle(angle)
 
     def format_yaw_angle(self, angle : float) -> float:
         """Formats angle into -180-180 domain"""
-        angle = self.normalize_angle(angle)
-        return angle if angle <= 180 else -180 + (angle - 180)
+        return format_yaw_angle(angle)
     
     @property
     def vector_sharing_resolution(self) -> QVector3D | None:
         """Returns vector sharing resolution"""
-        with QMutexLocker(self.__mutex):
-            return self.__vector_sharing_resolution
+        return self.__vector_sharing_resolution
     
     @vector_sharing_resolution.setter
     def vector_sharing_resolution(self, value : QVector3D | None) -> None:
         """Sets vector sharing resolution"""
-        with QMutexLocker(self.__mutex):
-            self.__vector_sharing_resolution = value
+        self.__vector_sharing_resolution = value
 
     @property
     def safe_zone_occupied(self) -> bool:
         """Returns safe zone occupied state"""
-        with QMutexLocker(self.__mutex):
-            return self.__safe_zone_occupied
+        return self.__safe_zone_occupied
     
     @safe_zone_occupied.setter
     def safe_zone_occupied(self, value : bool) -> None:
         """Sets safe zone occupied state"""
         with QMutexLocker(self.__mutex):
             if self.__safe_zone_occupied and value:
-                print("Safe zone already occupied")
                 logging.warning("Safe zone already occupied")
             if not self.__safe_zone_occupied and not value:
-                print("Safe zone already free")
                 logging.warning("Safe zone already free")
             self.__safe_zone_occupied = value
     
     @property
     def evade_maneuver(self) -> bool:
         """Returns evade maneuver state"""
-        with QMutexLocker(self.__mutex):
-            return self.__evade_maneuver
+        return self.__evade_maneuver
 
     def apply_evade_maneuver(self, opponent_speed : QVector3D, miss_distance_vector : QVector3D, unresolved_region : float, time_to_closest_approach : float) -> None:
         """Applies evade maneuver"""
-        print("FCC " + str(self.aircraft.aircraft_id) + ": Opponent speed: (" + "{:.2f}".format(opponent_speed.x()) + ", " + "{:.2f}".format(opponent_speed.y()) + ", " + "{:.2f}".format(opponent_speed.z()) + ")")
-        print("FCC " + str(self.aircraft.aircraft_id) + ": Miss distance vector: (" + "{:.2f}".format(miss_distance_vector.x()) + ", " + "{:.2f}".format(miss_distance_vector.y()) + ", " + "{:.2f}".format(miss_distance_vector.z()) + ")")
-        print("FCC " + str(self.aircraft.aircraft_id) + ": Unresolved region: " + "{:.2f}".format(unresolved_region))
-        print("FCC " + str(self.aircraft.aircraft_id) + ": Time to closest approach: " + "{:.2f}".format(time_to_closest_approach))
+        logging.debug(
+            "FCC %s: Opponent speed: (%.2f, %.2f, %.2f), miss distance vector: (%.2f, %.2f, %.2f), unresolved region: %.2f, time to closest approach: %.2f",
+            self.aircraft_id,
+            opponent_speed.x(), opponent_speed.y(), opponent_speed.z(),
+            miss_distance_vector.x(), miss_distance_vector.y(), miss_distance_vector.z(),
+            unresolved_region, time_to_closest_approach)
 
         if self.__evade_maneuver:
             logging.warning("Another evade maneuver in progress")
         else:
-            print(f"Aircraft {self.aircraft.aircraft_id} applying evade maneuver")
             logging.info("Aircraft %s applying evade maneuver", self.aircraft.aircraft_id)
             self.__evade_maneuver = True
 
-            if miss_distance_vector.length() == 0:
-                miss_distance_vector = QVector3D(
-                    (random.choice([-1, 1])) * self.aircraft.size * 0.1,
-                    (random.choice([-1, 1])) * self.aircraft.size * 0.1, 0.0)
-
-            target_avoiding : QVector3D = QVector3D()
-            self.vector_sharing_resolution : QVector3D | None = None
+            miss_x : float = miss_distance_vector.x()
+            miss_y : float = miss_distance_vector.y()
+            miss_z : float = miss_distance_vector.z()
+            miss_distance : float = hypot(miss_x, miss_y, miss_z)
+            if miss_distance < HEAD_ON_MISS_DISTANCE:
+                miss_x = (random.choice([-1, 1])) * self.aircraft.size * 0.1
+                miss_y = (random.choice([-1, 1])) * self.aircraft.size * 0.1
+                miss_z = 0.0
+                miss_distance = hypot(miss_x, miss_y)
+
+            speed : QVector3D = self.aircraft.speed
+            speed_x : float = speed.x()
+            speed_y : float = speed.y()
+            speed_z : float = speed.z()
+            opponent_speed_length : float = hypot(opponent_speed.x(), opponent_speed.y(), opponent_speed.z())
+            scale : float = opponent_speed_length * unresolved_region / ((hypot(speed_x, speed_y, speed_z) + opponent_speed_length) * miss_distance)
             if self.aircraft_id == 0:
-                self.vector_sharing_resolution = (opponent_speed.length() * unresolved_region * -(miss_distance_vector)) / ((self.aircraft.speed.length() + opponent_speed.length()) * miss_distance_vector.length())
-            elif self.aircraft_id == 1:
-                self.vector_sharing_resolution = (opponent_speed.length() * unresolved_region * miss_distance_vector) / ((opponent_speed.length() + self.aircraft.speed.length()) * miss_distance_vector.length())
-            print("Vector sharing resolution: (" + "{:.2f}".format(self.vector_sharing_resolution.x()) + ", " + "{:.2f}".format(self.vector_sharing_resolution.y()) + ", " + "{:.2f}".format(self.vector_sharing_resolution.z()) + ")")
-            modified_speed_vector : QVector3D = (self.aircraft.speed * time_to_closest_approach + self.vector_sharing_resolution)
-            unit_vector : QVector3D = modified_speed_vector.normalized()
-            target_avoiding = self.aircraft.position + (unit_vector * modified_speed_vector.length())
+                scale = -scale
+            resolution_x : float = miss_x * scale
+            resolution_y : float = miss_y * scale
+            resolution_z : float = miss_z * scale
+            self.vector_sharing_resolution = QVector3D(resolution_x, resolution_y, resolution_z)
+            logging.debug("FCC %s: Vector sharing resolution: (%.2f, %.2f, %.2f)", self.aircraft_id, resolution_x, resolution_y, resolution_z)
+            position : QVector3D = self.aircraft.position
+            target_avoiding : QVector3D = QVector3D(
+                position.x() + speed_x * time_to_closest_approach + resolution_x,
+                position.y() + speed_y * time_to_closest_approach + resolution_y,
+                position.z() + speed_z * time_to_closest_approach + resolution_z)
             
-            print("Set target avoiding collision: (" + "{:.2f}".format(target_avoiding.x()) + ", " + "{:.2f}".format(target_avoiding.y()) + ", " + "{:.2f}".format(target_avoiding.z()) + ")")
+            logging.debug("FCC %s: Set target avoiding collision: (%.2f, %.2f, %.2f)", self.aircraft_id, target_avoiding.x(), target_avoiding.y(), target_avoiding.z())
             self.add_first_destination(target_avoiding)
 
     def reset_evade_maneuver(self) -> None:
@@ -346,96 +324,107 @@ class AircraftFCC(QObject):
 
     def find_best_roll_angle(self, current_yaw_angle: float, target_yaw_angle: float) -> float:
         """Finds best roll angle for the targeted yaw angle"""
-        difference = (target_yaw_angle - current_yaw_angle + 180) % 360 - 180
-        if abs(difference) < 0.001:
-            self.is_turning_right = False
-            self.is_turning_left = False
-            return 0.0
-        elif difference > 0:
-            self.is_turning_right = True
-            self.is_turning_left = False
-            if difference > 90:
-                return 30.0
-            elif difference > 45:
-                return 20.0
-            elif difference > 20:
-                return 10.0
-            else:
-                return 5.0
-        elif difference < 0:
-            self.is_turning_left = True
-            self.is_turning_right = False
-            if difference < -90:
-                return -30.0
-            elif difference < -45:
-                return -20.0
-            elif difference < -20:
-                return -10.0
-            else:
-                return -5.0
-        else:
-            return 0.0
+        return self.select_roll_angle(yaw_difference(current_yaw_angle, target_yaw_angle))
+
+    def select_roll_angle(self, difference : float) -> float:
+        """Selects roll angle for the signed yaw difference and updates turning state"""
+        roll_angle : float = roll_angle_for_yaw_difference(difference)
+        self.is_turning_right = roll_angle > 0
+        self.is_turning_left = roll_angle < 0
+        return roll_angle
         
     def find_best_yaw_angle(self, position : QVector3D, destination : QVector3D) -> float:
         """Finds best yaw angle for the given destination"""
-        target_yaw_angle : float  = degrees(atan2(
-            destination.y() - position.y(),
-            destination.x() - position.x()))
-        target_yaw_angle += 90
-        return self.format_yaw_angle(target_yaw_angle)
+        return yaw_angle_towards(destination.x() - position.x(), destination.y() - position.y())
     
     def find_best_pitch_angle(self, position : QVector3D, destination : QVector3D) -> float:
         """Finds best pitch angle for the given destination"""
-        target_pitch_angle : float = degrees(atan2(
-            destination.z() - position.z(),
-            dist(position.toTuple(), destination.toTuple())))
-        return target_pitch_angle
+        return pitch_angle_towards(destination.x() - position.x(), destination.y() - position.y(), destination.z() - position.z())
 
-    def update_target_yaw_pitch_angles(self) -> None:
-        """Updates current yaw angle"""
+    def update_target_yaw_pitch_angles(self, position : QVector3D | None = None) -> float | None:
+        """Updates current yaw angle, returns new target yaw angle if it was set"""
         if self.destinations and self.autopilot and not self.ignore_destinations:
-            destination = self.destinations[0]
-            distance = self.aircraft.position.distanceToPoint(destination)
-            if distance < self.aircraft.size * 5: # [x] Tmp set to 5 instead of size / 2
-                self.destinations_history.append(self.destinations.popleft())
-                if self.destinations:
-                    destination = self.destinations[0]
-                    logging.info("Aircraft %s visited destination and took next one", self.aircraft.aircraft_id)
-                    print(f"Aircraft {self.aircraft.aircraft_id} visited destination and took next one")
+            aircraft : AircraftVehicle = self.aircraft
+            if position is None:
+                position = aircraft.position
+            px : float = position.x()
+            py : float = position.y()
+            pz : float = position.z()
+            destinations : deque[QVector3D] = self.destinations
+            destination : QVector3D = destinations[0]
+            dx : float = destination.x() - px
+            dy : float = destination.y() - py
+            dz : float = destination.z() - pz
+            if dx * dx + dy * dy + dz * dz < self.__arrival_distance_squared:
+                with QMutexLocker(self.__mutex):
+                    self.__destinations_history.append(destinations.popleft())
+                if destinations:
+                    destination = destinations[0]
+                    dx = destination.x() - px
+                    dy = destination.y() - py
+                    dz = destination.z() - pz
+                    logging.info("Aircraft %s visited destination and took next one", aircraft.aircraft_id)
                 else:
-                    logging.info("Aircraft %s visited destination and is free now", self.aircraft.aircraft_id)
-                    print(f"Aircraft {self.aircraft.aircraft_id} visited destination and is free now")
-                    return
-            self.target_yaw_angle = self.find_best_yaw_angle(
-                self.aircraft.position,
-                destination)
-            self.target_pitch_angle = self.find_best_pitch_angle(
-                self.aircraft.position,
-                destination)
+                    logging.info("Aircraft %s visited destination and is free now", aircraft.aircraft_id)
+                    return None
+            target_yaw_angle : float = yaw_angle_towards(dx, dy)
+            self.target_pitch_angle = pitch_angle_towards(dx, dy, dz)
+            self.target_yaw_angle = target_yaw_angle
+            return target_yaw_angle
+        return None
             
-    def update_target_roll_angle(self) -> None:
+    def distance_to(self, point : QVector3D, position : QVector3D | None = None) -> float:
+        """Returns distance from aircraft position to given point"""
+        if position is None:
+            position = self.aircraft.position
+        return hypot(position.x() - point.x(), position.y() - point.y(), position.z() - point.z())
+
+    def squared_distance_to(self, point : QVector3D, position : QVector3D | None = None) -> float:
+        """Returns squared distance from aircraft position to given point"""
+        if position is None:
+            position = self.aircraft.position
+        dx : float = position.x() - point.x()
+        dy : float = position.y() - point.y()
+        dz : float = position.z() - point.z()
+        return dx * dx + dy * dy + dz * dz
+
+    def lookahead_yaw_angle(self, destination : QVector3D, next_destination : QVector3D) -> float:
+        """Returns yaw angle of the leg between given destinations, reused while the pair stays the same"""
+        lookahead = self.__lookahead
+        if lookahead is None or lookahead[0] is not destination or lookahead[1] is not next_destination:
+            lookahead = (destination, next_destination, self.find_best_yaw_angle(destination, next_destination))
+            self.__lookahead = lookahead
+        return lookahead[2]
+
+    def update_target_roll_angle(self, position : QVector3D | None = None, target_yaw_angle : float | None = None) -> None:
         """Updates target roll angle"""
-        current_yaw_angle = self.normalize_angle(self.aircraft.yaw_angle)
-        target_yaw_angle = self.normalize_angle(self.target_yaw_angle)
-        self.target_roll_angle = self.find_best_roll_angle(current_yaw_angle, target_yaw_angle)
-
-        if len(self.destinations) > 1 and dist(self.aircraft.position.toTuple(), self.destinations[0].toTuple()) < self.aircraft.speed.length():
-            difference = (target_yaw_angle - current_yaw_angle + 180) % 360 - 180
-            if abs(difference) < 0.01:
-                next_position = self.destinations[0]
-                next_destination = self.destinations[1]
-                next_target_yaw_angle : float = self.find_best_yaw_angle(next_position, next_destination)
-                self.target_roll_angle = self.find_best_roll_angle(current_yaw_angle, next_target_yaw_angle)
+        aircraft : AircraftVehicle = self.aircraft
+        current_yaw_angle : float = aircraft.yaw_angle
+        if target_yaw_angle is None:
+            target_yaw_angle = self.target_yaw_angle
+        difference : float = yaw_difference(current_yaw_angle, target_yaw_angle)
+        destinations : deque[QVector3D] = self.destinations
+        if len(destinations) > 1 and abs(difference) < 0.01 and self.squared_distance_to(destinations[0], position) < aircraft.speed.lengthSquared():
+            next_target_yaw_angle : float = self.lookahead_yaw_angle(destinations[0], destinations[1])
+            self.target_roll_angle = self.find_best_roll_angle(current_yaw_angle, next_target_yaw_angle)
+        else:
+            self.target_roll_angle = self.select_roll_angle(difference)
 
     def update(self) -> None:
         """Updates current targeted movement angles"""
-        self.update_target_yaw_pitch_angles()
-        self.update_target_roll_angle()
+        aircraft : AircraftVehicle = self.aircraft
+        if not self.destinations and self.target_roll_angle == 0.0 and abs(yaw_difference(aircraft.yaw_angle, self.target_yaw_angle)) < YAW_DEAD_BAND:
+            return # coasting straight with nothing to steer towards
+        position : QVector3D = aircraft.position
+        target_yaw_angle : float | None = self.update_target_yaw_pitch_angles(position)
+        self.update_target_roll_angle(position, target_yaw_angle)
 
     def update_target(self, target : QVector3D) -> None:
         """Updates target position"""
-        self.target_yaw_angle = self.find_best_yaw_angle(self.aircraft.position, target)
-        self.update_target_roll_angle()      
+        position : QVector3D = self.aircraft.position
+        target_yaw_angle : float = self.find_best_yaw_angle(position, target)
+        self.target_yaw_angle = target_yaw_angle
+        self.update_target_roll_angle(position, target_yaw_angle)      
 
     def reset(self) -> None:
         """Resets aircraft flight control computer"""
@@ -447,6 +436,7 @@ class AircraftFCC(QObject):
         self.__target_pitch_angle = 0.0
         self.__evade_maneuver = False
         self.__vector_sharing_resolution = None
+        self.__lookahead = None
         self.__safe_zone_occupied = False
         self.__autopilot = True
         self.__ignore_destinations = False
@@ -473,6 +463,7 @@ class AircraftFCC(QObject):
         with QMutexLocker(self.__mutex):
             del self.__aircraft_id
             del self.__aircraft
+            del self.__arrival_distance_squared
             del self.__destinations
             del self.__destinations_history
             del self.__visited
@@ -488,5 +479,6 @@ class AircraftFCC(QObject):
             del self.__safe_zone_occupied
             del self.__evade_maneuver
             del self.__vector_sharing_resolution
+            del self.__lookahead
             del self.__mutex
             del self
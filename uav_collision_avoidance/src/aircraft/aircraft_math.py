@@ -0,0 +1,39 @@
+"""Aircraft angle math helpers"""
+
+from bisect import bisect_left
+from math import atan2, copysign, degrees, hypot
+from typing import Tuple
+
+ROLL_ANGLE_THRESHOLDS : Tuple[float, ...] = (20.0, 45.0, 90.0)
+ROLL_ANGLES : Tuple[float, ...] = (5.0, 10.0, 20.0, 30.0)
+YAW_DEAD_BAND : float = 0.001
+HEAD_ON_MISS_DISTANCE : float = 1e-4 # miss distances below this give no avoidance direction
+
+def normalize_angle(angle : float) -> float:
+    """Normalizes -180-180 angle into 360 domain"""
+    return angle % 360
+
+def format_yaw_angle(angle : float) -> float:
+    """Formats angle into -180-180 domain"""
+    angle = angle % 360
+    return angle if angle <= 180 else angle - 360
+
+def yaw_angle_towards(dx : float, dy : float) -> float:
+    """Returns yaw angle in -180-180 domain heading along given coordinate differences"""
+    angle : float = (degrees(atan2(dy, dx)) + 90) % 360
+    return angle if angle <= 180 else angle - 360
+
+def pitch_angle_towards(dx : float, dy : float, dz : float) -> float:
+    """Returns pitch angle heading along given coordinate differences"""
+    return degrees(atan2(dz, hypot(dx, dy, dz)))
+
+def yaw_difference(current_yaw_angle : float, target_yaw_angle : float) -> float:
+    """Returns signed shortest turn from current to target yaw angle in -180-180 domain"""
+    return (target_yaw_angle - current_yaw_angle + 180) % 360 - 180
+
+def roll_angle_for_yaw_difference(difference : float) -> float:
+    """Returns roll angle for the signed yaw difference, positive for right turns"""
+    magnitude : float = abs(difference)
+    if magnitude < YAW_DEAD_BAND:
+        return 0.0
+    return copysign(ROLL_ANGLES[bisect_left(ROLL_ANGLE_THRESHOLDS, magnitude)], difference)
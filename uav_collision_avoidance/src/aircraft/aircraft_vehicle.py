@@ -1,6 +1,6 @@
 """Aircraft physical UAV class definition"""
 
-from math import atan2, degrees, sqrt
+from math import atan2, degrees, hypot
 
 from PySide6.QtCore import QObject, QMutex, QMutexLocker
 from PySide6.QtGui import QVector3D
@@ -30,8 +30,7 @@ class AircraftVehicle(QObject):
     @property
     def aircraft_id(self) -> int:
         """Returns aircraft id"""
-        with QMutexLocker(self.__mutex):
-            return self.__aircraft_id
+        return self.__aircraft_id
     
     @property
     def position(self) -> QVector3D:
@@ -61,8 +60,7 @@ class AircraftVehicle(QObject):
     @property
     def size(self) -> float:
         """Returns size"""
-        with QMutexLocker(self.__mutex):
-            return self.__size
+        return self.__size
     
     @property
     def roll_angle(self) -> float:
@@ -79,8 +77,7 @@ class AircraftVehicle(QObject):
     @property
     def initial_roll_angle(self) -> float:
         """Returns initial roll angle"""
-        with QMutexLocker(self.__mutex):
-            return self.__initial_roll_angle
+        return self.__initial_roll_angle
     
     @property
     def distance_covered(self) -> float:
@@ -127,7 +124,7 @@ class AircraftVehicle(QObject):
     def vertical_speed(self) -> float:
         """Returns vertical speed"""
         with QMutexLocker(self.__mutex):
-            return QVector3D(0, 0, self.__speed.z()).length()
+            return abs(self.__speed.z())
 
     @property
     def yaw_angle(self) -> float:
@@ -148,7 +145,7 @@ class AircraftVehicle(QObject):
     def pitch_angle(self) -> float:
         """Returns pitch angle"""
         with QMutexLocker(self.__mutex):
-            return degrees(atan2(self.__speed.z(), sqrt(self.__speed.x() ** 2 + self.__speed.y() ** 2)))
+            return degrees(atan2(self.__speed.z(), hypot(self.__speed.x(), self.__speed.y())))
 
     def __str__(self) -> str:
         with QMutexLocker(self.__mutex):
@@ -3,12 +3,12 @@
 import csv
 import logging
 import datetime
-import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 
 from copy import copy
+from itertools import count
 from pathlib import Path
 from typing import List, Tuple
 from numpy import random, ndarray
@@ -33,12 +33,12 @@ from ..simulation.simulation_data import SimulationData
 class Simulation(QMainWindow):
     """Main simulation App"""
 
-    __current_id : int = 0
+    __id_counter : count = count()
 
     def __init__(self, headless : bool = False, tests : bool = False, simulation_time : int = 1_209_600_000) -> None: # 1_209_600_000 ms = 1_209_600 s = 336 h = 14 days
         """Initializes simulation"""
         super().__init__()
-        SimulationSettings().__init__()
+        SimulationSettings.__init__()
         self.__simulation_id = self.obtain_simulation_id()
         self.__hash = self.obtain_simulation_hash()
         self.__headless : bool = headless
@@ -58,9 +58,7 @@ class Simulation(QMainWindow):
     @staticmethod
     def obtain_simulation_id() -> int:
         """Obtains new simulation id"""
-        simulation_id : int = Simulation.__current_id
-        Simulation.__current_id += 1
-        return simulation_id
+        return next(Simulation.__id_counter)
     
     @property
     def simulation_id(self) -> int:
@@ -231,8 +229,8 @@ class Simulation(QMainWindow):
         simulation_data.aircraft_2_initial_speed = copy(self.aircrafts[1].initial_speed)
         simulation_data.aircraft_1_initial_target = copy(self.aircrafts[0].initial_target)
         simulation_data.aircraft_2_initial_target = copy(self.aircrafts[1].initial_target)
-        simulation_data.aircraft_1_initial_roll_angle = copy(self.aircrafts[0].initial_roll_angle)
-        simulation_data.aircraft_2_initial_roll_angle = copy(self.aircrafts[1].initial_roll_angle)
+        simulation_data.aircraft_1_initial_roll_angle = self.aircrafts[0].initial_roll_angle
+        simulation_data.aircraft_2_initial_roll_angle = self.aircrafts[1].initial_roll_angle
         simulation_data.collision = False
 
         self.state = SimulationState(SimulationSettings(), is_realtime = False, avoid_collisions = avoid_collisions)
@@ -240,31 +238,13 @@ class Simulation(QMainWindow):
         self.simulation_adsb = SimulationADSB(self, self.aircrafts, self.state)
         self.simulation_adsb.is_silent = True
         self.simulation_adsb.reset_destinations()
-        time_step : int = int(self.state.simulation_threshold)
-        adsb_step : int = int(self.state.adsb_threshold)
-        partial_time_counter : int = adsb_step
-        for time in range(0, int(self.simulation_time / self.state.simulation_threshold), time_step):
-            self.simulation_physics.cycle(time_step)
-            if partial_time_counter >= adsb_step:
-                self.simulation_adsb.cycle()
-                partial_time_counter = 0
-            partial_time_counter += time_step
-            if self.simulation_adsb.relative_distance > self.state.minimum_separation * 2 and self.simulation_adsb.minimal_relative_distance < self.state.minimum_separation:
-                logging.info("Headless simulation stopping due to aircrafts too far apart")
-                break
-            if not self.aircrafts[0].fcc.destination and not self.aircrafts[1].fcc.destination:
-                logging.info("Headless simulation stopping due to no other destinations set")
-                break
-            if self.state.collision:
-                logging.info("Headless simulation stopping due to collision detected")
-                simulation_data.collision = True
-                break
-        simulation_data.minimal_relative_distance = copy(self.simulation_adsb.minimal_relative_distance)
+        self.run_headless_loop(simulation_data)
+        simulation_data.minimal_relative_distance = self.simulation_adsb.minimal_relative_distance
         simulation_data.aircraft_1_final_position = copy(self.aircrafts[0].vehicle.position)
         simulation_data.aircraft_2_final_position = copy(self.aircrafts[1].vehicle.position)
         simulation_data.aircraft_1_final_speed = copy(self.aircrafts[0].vehicle.speed)
         simulation_data.aircraft_2_final_speed = copy(self.aircrafts[1].vehicle.speed)
-        simulation_data.miss_distance_at_closest_approach = copy(self.simulation_adsb.miss_distance_at_closest_approach)
+        simulation_data.miss_distance_at_closest_approach = self.simulation_adsb.miss_distance_at_closest_approach
         if self.imported_from_data:
             self.check_simulation_data_correctness()
         if test_index is not None:
@@ -274,6 +254,34 @@ class Simulation(QMainWindow):
         self.stop()
         return simulation_data
     
+    def run_headless_loop(self, simulation_data : SimulationData) -> None:
+        """Steps headless simulation in a plain loop until one of stop conditions is met"""
+        state : SimulationState = self.state
+        physics : SimulationPhysics = self.simulation_physics
+        adsb : SimulationADSB = self.simulation_adsb
+        first_fcc : AircraftFCC = self.aircrafts[0].fcc
+        second_fcc : AircraftFCC = self.aircrafts[1].fcc
+        minimum_separation : float = state.minimum_separation
+        time_step : int = int(state.simulation_threshold)
+        adsb_step : int = int(state.adsb_threshold)
+        partial_time_counter : int = adsb_step
+        for time in range(0, int(self.simulation_time / state.simulation_threshold), time_step):
+            physics.cycle(time_step)
+            if partial_time_counter >= adsb_step:
+                adsb.cycle()
+                partial_time_counter = 0
+            partial_time_counter += time_step
+            if adsb.minimal_relative_distance < minimum_separation and adsb.relative_distance > minimum_separation * 2:
+                logging.info("Headless simulation stopping due to aircrafts too far apart")
+                break
+            if not first_fcc.destination and not second_fcc.destination:
+                logging.info("Headless simulation stopping due to no other destinations set")
+                break
+            if state.collision:
+                logging.info("Headless simulation stopping due to collision detected")
+                simulation_data.collision = True
+                break
+    
     def generate_test_aircrafts(self) -> List[Tuple[List[Aircraft], float]]:
         """Generates test cases consisting of
         list of lists of aircrafts and angle between them"""
@@ -607,7 +615,7 @@ class Simulation(QMainWindow):
             print("Test " + str(i) + " - no collision avoidance")
             logging.info("Test %d - no collision avoidance", i)
             aircraft_tuple : List[List[Aircraft], float] = list_of_lists[i]
-            aircrafts : List[Aircraft] = copy(aircraft_tuple[0])
+            aircrafts : List[Aircraft] = list(aircraft_tuple[0])
             angle : float = aircraft_tuple[1]
             print("Current test pair aircrafts count: ", len(aircrafts))
             simulation_data_no_avoidance : SimulationData = self.run_headless(
@@ -621,7 +629,7 @@ class Simulation(QMainWindow):
 
             print("Test " + str(i) + " - collision avoidance")
             logging.info("Test %d - collision avoidance", i)
-            aircrafts = copy(aircraft_tuple[0])
+            aircrafts = list(aircraft_tuple[0])
             simulation_data_avoidance : SimulationData = self.run_headless(
                 avoid_collisions = True,
                 aircrafts = aircrafts,
@@ -708,7 +716,7 @@ class Simulation(QMainWindow):
         real_time : float = start_timestamp.msecsTo(QTime.currentTime()) / 1000
         print("Total time elapsed: " + "{:.2f}".format(real_time) + "s")
         print("Average time per test: " + "{:.2f}".format(real_time / test_number) + "s")
-        logging.info("Total time elapsed: %ss", "{:.2f}".format(real_time))
+        logging.info("Total time elapsed: %.2fs", real_time)
 
     def load_latest_simulation_data_file(self) -> bool:
         """Loads latest simulation data from file"""
@@ -754,51 +762,62 @@ class Simulation(QMainWindow):
         else:
             return False
 
+    @staticmethod
+    def read_simulation_data_file(file_path : str) -> pd.DataFrame:
+        """Reads simulation data file into memory"""
+        return pd.read_csv(file_path, engine = "c", float_precision = "round_trip")
+
     def load_simulation_data_from_file(self, file_path : str, test_id : int = 0, avoid_collisions : bool = False) -> bool:
         """Loads simulation data from file"""
         logging.info("Loading simulation data from file %s", file_path)
+        try:
+            data : pd.DataFrame = self.read_simulation_data_file(file_path)
+        except (OSError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+            logging.error("Failed to load simulation data from file: %s", e)
+            return False
+        return self.load_simulation_data_from_memory(data, test_id = test_id, avoid_collisions = avoid_collisions)
+
+    def load_simulation_data_from_memory(self, data : pd.DataFrame, test_id : int = 0, avoid_collisions : bool = False) -> bool:
+        """Loads simulation data from already read data file"""
         self.__aircrafts = []
         try:
-            file = open(file_path, "r")
-            reader = csv.reader(file)
-            for i, row in enumerate(reader):
-                if i == test_id + 1:
-                    simulation_data : SimulationData = SimulationData()
-                    assert len(row) == 50
-                    assert row[0] == str(test_id)
-                    simulation_data.aircraft_angle = float(row[1])
-                    simulation_data.aircraft_1_initial_position = QVector3D(float(row[2]), float(row[3]), float(row[4]))
-                    simulation_data.aircraft_2_initial_position = QVector3D(float(row[5]), float(row[6]), float(row[7]))
-                    simulation_data.aircraft_1_initial_speed = QVector3D(float(row[8]), float(row[9]), float(row[10]))
-                    simulation_data.aircraft_2_initial_speed = QVector3D(float(row[11]), float(row[12]), float(row[13]))
-                    simulation_data.aircraft_1_initial_target = QVector3D(float(row[14]), float(row[15]), float(row[16]))
-                    simulation_data.aircraft_2_initial_target = QVector3D(float(row[17]), float(row[18]), float(row[19]))
-                    if not avoid_collisions:
-                        simulation_data.aircraft_1_final_position = QVector3D(float(row[20]), float(row[21]), float(row[22]))
-                        simulation_data.aircraft_2_final_position = QVector3D(float(row[23]), float(row[24]), float(row[25]))
-                        simulation_data.aircraft_1_final_speed = QVector3D(float(row[32]), float(row[33]), float(row[34]))
-                        simulation_data.aircraft_2_final_speed = QVector3D(float(row[35]), float(row[36]), float(row[37]))
-                        simulation_data.collision = row[44] == "True"
-                        simulation_data.minimal_relative_distance = float(row[46])
-                        if str(row[48]) == "nan":
-                            simulation_data.miss_distance_at_closest_approach = None
-                        else:
-                            simulation_data.miss_distance_at_closest_approach = float(row[48])
-                    else:
-                        simulation_data.aircraft_1_final_position = QVector3D(float(row[26]), float(row[27]), float(row[28]))
-                        simulation_data.aircraft_2_final_position = QVector3D(float(row[29]), float(row[30]), float(row[31]))
-                        simulation_data.aircraft_1_final_speed = QVector3D(float(row[38]), float(row[39]), float(row[40]))
-                        simulation_data.aircraft_2_final_speed = QVector3D(float(row[41]), float(row[42]), float(row[43]))
-                        simulation_data.collision = row[45] == "True"
-                        simulation_data.minimal_relative_distance = float(row[47])
-                        if str(row[49]) == "nan":
-                            simulation_data.miss_distance_at_closest_approach = None
-                        else:
-                            simulation_data.miss_distance_at_closest_approach = float(row[49])
-                    self.import_simulation_data(simulation_data)
-                    return True
-        except:
-            logging.error("Failed to load simulation data from file")
+            row : ndarray = data.iloc[test_id].to_numpy()
+            simulation_data : SimulationData = SimulationData()
+            assert len(row) == 50
+            assert str(row[0]) == str(test_id)
+            simulation_data.aircraft_angle = float(row[1])
+            simulation_data.aircraft_1_initial_position = QVector3D(float(row[2]), float(row[3]), float(row[4]))
+            simulation_data.aircraft_2_initial_position = QVector3D(float(row[5]), float(row[6]), float(row[7]))
+            simulation_data.aircraft_1_initial_speed = QVector3D(float(row[8]), float(row[9]), float(row[10]))
+            simulation_data.aircraft_2_initial_speed = QVector3D(float(row[11]), float(row[12]), float(row[13]))
+            simulation_data.aircraft_1_initial_target = QVector3D(float(row[14]), float(row[15]), float(row[16]))
+            simulation_data.aircraft_2_initial_target = QVector3D(float(row[17]), float(row[18]), float(row[19]))
+            if not avoid_collisions:
+                simulation_data.aircraft_1_final_position = QVector3D(float(row[20]), float(row[21]), float(row[22]))
+                simulation_data.aircraft_2_final_position = QVector3D(float(row[23]), float(row[24]), float(row[25]))
+                simulation_data.aircraft_1_final_speed = QVector3D(float(row[32]), float(row[33]), float(row[34]))
+                simulation_data.aircraft_2_final_speed = QVector3D(float(row[35]), float(row[36]), float(row[37]))
+                simulation_data.collision = str(row[44]) == "True"
+                simulation_data.minimal_relative_distance = float(row[46])
+                if str(row[48]) == "nan":
+                    simulation_data.miss_distance_at_closest_approach = None
+                else:
+                    simulation_data.miss_distance_at_closest_approach = float(row[48])
+            else:
+                simulation_data.aircraft_1_final_position = QVector3D(float(row[26]), float(row[27]), float(row[28]))
+                simulation_data.aircraft_2_final_position = QVector3D(float(row[29]), float(row[30]), float(row[31]))
+                simulation_data.aircraft_1_final_speed = QVector3D(float(row[38]), float(row[39]), float(row[40]))
+                simulation_data.aircraft_2_final_speed = QVector3D(float(row[41]), float(row[42]), float(row[43]))
+                simulation_data.collision = str(row[45]) == "True"
+                simulation_data.minimal_relative_distance = float(row[47])
+                if str(row[49]) == "nan":
+                    simulation_data.miss_distance_at_closest_approach = None
+                else:
+                    simulation_data.miss_distance_at_closest_approach = float(row[49])
+            self.import_simulation_data(simulation_data)
+            return True
+        except (KeyError, IndexError, ValueError, AssertionError) as e:
+            logging.error("Failed to load simulation data: %r", e)
             return False
     
     def stop(self) -> None:
@@ -834,7 +853,7 @@ class Simulation(QMainWindow):
             print("Time elapsed: " + "{:.2f}".format(real_time) + "s (" + "{:.2f}".format(real_time_pauses) + "s with pauses)")
         if real_time != 0:
             print("Time efficiency: " + "{:.2f}".format(simulated_time / real_time * 100) + "%")
-            logging.info("Calculated time efficiency: " + "{:.2f}".format(simulated_time / real_time * 100) + "%")
+            logging.info("Calculated time efficiency: %.2f%%", simulated_time / real_time * 100)
 
         self.export_visited_locations()
         self.simulation_adsb.quit()
@@ -1044,19 +1063,20 @@ class Simulation(QMainWindow):
 
         for i, aircraft in enumerate(aircraft_fccs):
             file_name = f"logs/visited/visited-aircraft-{aircraft.aircraft_id}-{export_time}"
+            x_points : List[float] = []
+            y_points : List[float] = []
             with open(f"{file_name}.csv", "w") as file:
                 writer = csv.writer(file)
                 writer.writerow(["x","y","z"])
-                for position in aircraft.visited:
-                    x_minimum = min(x_minimum, position.x())
-                    x_maximum = max(x_maximum, position.x())
-                    y_minimum = min(y_minimum, position.y())
-                    y_maximum = max(y_maximum, position.y())
-                    writer.writerow([("{:.2f}".format(position.x())),("{:.2f}".format(position.y())),("{:.2f}".format(position.z()))])
-                    
-            df = pd.read_csv(f"{file_name}.csv")
-            x_points = np.array(df["x"])
-            y_points = np.array(df["y"])
+                for x, y, z in aircraft.visited:
+                    x_minimum = min(x_minimum, x)
+                    x_maximum = max(x_maximum, x)
+                    y_minimum = min(y_minimum, y)
+                    y_maximum = max(y_maximum, y)
+                    x_points.append(x)
+                    y_points.append(y)
+                    writer.writerow([("{:.2f}".format(x)),("{:.2f}".format(y)),("{:.2f}".format(z))])
+
             plt.scatter(x_points, y_points, color=colors[i % len(colors)], s = 2)
             plt.plot(x_points, y_points, color=colors[i % len(colors)])
 
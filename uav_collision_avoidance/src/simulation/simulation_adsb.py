@@ -12,6 +12,7 @@ from PySide6.QtWidgets import QMainWindow
 from ..aircraft.aircraft import Aircraft
 from ..aircraft.aircraft_vehicle import AircraftVehicle
 from ..aircraft.aircraft_fcc import AircraftFCC
+from ..aircraft.aircraft_math import HEAD_ON_MISS_DISTANCE
 from .simulation_state import SimulationState
 
 class SimulationADSB(QThread):
@@ -36,13 +37,11 @@ class SimulationADSB(QThread):
     @property
     def aircraft_vehicles(self) -> List[AircraftVehicle]:
         """Returns aircraft vehicles"""
-        self.__aircraft_vehicles = [aircraft.vehicle for aircraft in self.aircrafts]
         return self.__aircraft_vehicles
     
     @property
     def aircraft_fccs(self) -> List[AircraftFCC]:
         """Returns aircraft flight control computers"""
-        self.__aircraft_fccs = [aircraft.fcc for aircraft in self.aircrafts]
         return self.__aircraft_fccs
     
     @property
@@ -116,13 +115,15 @@ class SimulationADSB(QThread):
             self.simulation_state.update_adsb_settings()
 
             relative_position = aircraft_vehicle_1.position - aircraft_vehicle_2.position
+            relative_distance : float = relative_position.length()
+            minimum_separation : float = self.simulation_state.minimum_separation
             speed_difference = aircraft_vehicle_1.speed - aircraft_vehicle_2.speed
             time_to_closest_approach = -(QVector3D.dotProduct(relative_position, speed_difference) / QVector3D.dotProduct(speed_difference, speed_difference))
             if not self.is_silent:
                 print("Time to closest approach: " + "{:.2f}".format(time_to_closest_approach) + "s")
             
-            if relative_position.length() < self.__minimal_relative_distance:
-                self.__minimal_relative_distance = relative_position.length()
+            if relative_distance < self.__minimal_relative_distance:
+                self.__minimal_relative_distance = relative_distance
             if not self.is_silent:
                 print("Minimal relative distance: " + "{:.2f}".format(self.__minimal_relative_distance) + "m")
             
@@ -156,7 +157,7 @@ class SimulationADSB(QThread):
                         self.print_adsb_report(aircraft)
 
                 # safe zone occupancy check
-                if relative_position.length() < self.simulation_state.minimum_separation:
+                if relative_distance < minimum_separation:
                     if not fcc.safe_zone_occupied:
                         fcc.safe_zone_occupied = True
                         if not self.simulation_state.override_avoid_collisions:
@@ -177,35 +178,36 @@ class SimulationADSB(QThread):
                 miss_distance_vector : QVector3D = QVector3D.crossProduct(
                     speed_difference_unit,
                     QVector3D.crossProduct(relative_position, speed_difference_unit))
+                miss_distance : float = miss_distance_vector.length()
                 if not self.is_silent:
-                    print("Miss distance at closest approach: " + "{:.2f}".format(miss_distance_vector.length()) + "m (" + "{:.2f}".format(self.aircraft_vehicles[0].size / 2 + self.aircraft_vehicles[1].size / 2) + "m is collision distance)")
+                    print("Miss distance at closest approach: " + "{:.2f}".format(miss_distance) + "m (" + "{:.2f}".format(self.aircraft_vehicles[0].size / 2 + self.aircraft_vehicles[1].size / 2) + "m is collision distance)")
 
-                if miss_distance_vector.length() == 0 and self.simulation_state.avoid_collisions:
+                if miss_distance < HEAD_ON_MISS_DISTANCE and self.simulation_state.avoid_collisions:
                     logging.info("Head-on collision detected")
                     if not self.is_silent:
                         print("Head-on collision detected")
 
                 # resolve conflict condition
-                unresolved_region : float = self.simulation_state.minimum_separation - abs(miss_distance_vector.length())
+                unresolved_region : float = minimum_separation - abs(miss_distance)
                 if unresolved_region > 0.0:
                     if not self.is_silent:
                         print("Conflict condition detected")
-                    if self.simulation_state.avoid_collisions and relative_position.length() < self.simulation_state.minimum_separation:
+                    if self.simulation_state.avoid_collisions and relative_distance < minimum_separation:
                         for aircraft in self.aircraft_fccs:
                             if not aircraft.evade_maneuver:
-                                logging.info("Conflict condition resolution with relative distance: " + "{:.2f}".format(relative_position.length()) + "m")
-                                self.miss_distance_at_closest_approach = miss_distance_vector.length()
+                                logging.info("Conflict condition resolution with relative distance: %.2fm", relative_distance)
+                                self.miss_distance_at_closest_approach = miss_distance
                                 aircraft.apply_evade_maneuver(
                                     opponent_speed = self.aircraft_vehicles[1 - aircraft.aircraft_id].speed,
                                     miss_distance_vector = miss_distance_vector,
                                     unresolved_region = unresolved_region,
                                     time_to_closest_approach = time_to_closest_approach)
                     if not self.is_silent:
-                        print("Relative distance: "+ "{:.2f}".format(relative_position.length()) + "m")
+                        print("Relative distance: "+ "{:.2f}".format(relative_distance) + "m")
 
                 # probable collision
                 collision_distance = aircraft_vehicle_1.size / 2 + aircraft_vehicle_2.size / 2
-                collision_region = collision_distance - miss_distance_vector.length()
+                collision_region = collision_distance - miss_distance
                 if collision_region > 0 and not self.is_silent:
                         print("Collision detected")
             else:
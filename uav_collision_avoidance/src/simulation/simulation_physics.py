@@ -1,9 +1,8 @@
 """Simulation physics thread module"""
 
 import logging
-from copy import copy
-from math import sin, cos, dist, tan, radians, sqrt
-from typing import List
+from math import sin, cos, tan, radians, sqrt, copysign
+from typing import List, Tuple
 
 from PySide6.QtCore import QThread, QTime
 from PySide6.QtGui import QVector3D
@@ -14,6 +13,13 @@ from ..aircraft.aircraft_vehicle import AircraftVehicle
 from ..aircraft.aircraft_fcc import AircraftFCC
 from .simulation_state import SimulationState
 
+def compute_position_step(speed_x : float, speed_y : float, speed_z : float, elapsed_time : float) -> Tuple[float, float, float, float]:
+    """Returns position deltas and distance covered for given speed over elapsed time in ms"""
+    dx : float = speed_x * elapsed_time / 1000.0
+    dy : float = speed_y * elapsed_time / 1000.0
+    dz : float = speed_z * elapsed_time / 1000.0
+    return dx, dy, dz, sqrt(dx * dx + dy * dy + dz * dz)
+
 class SimulationPhysics(QThread):
     """Thread running simulation's physics"""
 
@@ -35,13 +41,11 @@ class SimulationPhysics(QThread):
     @property
     def aircraft_vehicles(self) -> List[AircraftVehicle]:
         """Returns aircraft vehicles"""
-        self.__aircraft_vehicles = [aircraft.vehicle for aircraft in self.aircrafts]
         return self.__aircraft_vehicles
     
     @property
     def aircraft_fccs(self) -> List[AircraftFCC]:
         """Returns aircraft flight control computers"""
-        self.__aircraft_fccs = [aircraft.fcc for aircraft in self.aircrafts]
         return self.__aircraft_fccs
     
     @property
@@ -113,21 +117,23 @@ class SimulationPhysics(QThread):
     def update_aircrafts_position(self, elapsed_time : float) -> bool:
         """Updates aircrafts position, returns true on collision"""
         for aircraft in self.aircraft_vehicles:
-            if aircraft.position.z() <= 0.0:
-                logging.warning("Aircraft's " + str(aircraft.aircraft_id) + "collision with the ground. Coordinates: " + str(self.aircraft_vehicles[aircraft.aircraft_id].position.toTuple()))
+            position : QVector3D = aircraft.position
+            if position.z() <= 0.0:
+                logging.warning("Aircraft's %s collision with the ground. Coordinates: %s", aircraft.aircraft_id, self.aircraft_vehicles[aircraft.aircraft_id].position.toTuple())
                 print("Collision with ground")
                 return True
-            relative_distance : float = dist(aircraft.position.toTuple(), self.aircraft_vehicles[1 - aircraft.aircraft_id].position.toTuple())
-            if relative_distance <= aircraft.size:
-                logging.warning("Aircrafts' 0 and 1 collision. Coordinates: " + str(self.aircraft_vehicles[0].position.toTuple()) + " and " + str(self.aircraft_vehicles[1].position.toTuple()))
+            opponent_position : QVector3D = self.aircraft_vehicles[1 - aircraft.aircraft_id].position
+            offset_x : float = position.x() - opponent_position.x()
+            offset_y : float = position.y() - opponent_position.y()
+            offset_z : float = position.z() - opponent_position.z()
+            if offset_x * offset_x + offset_y * offset_y + offset_z * offset_z <= aircraft.size ** 2:
+                logging.warning("Aircrafts' 0 and 1 collision. Coordinates: %s and %s", self.aircraft_vehicles[0].position.toTuple(), self.aircraft_vehicles[1].position.toTuple())
                 print("Collision with another aircraft")
                 return True
-            old_pos : QVector3D = copy(aircraft.position)
-            aircraft.move(
-                aircraft.speed.x() * elapsed_time / 1000.0,
-                aircraft.speed.y() * elapsed_time / 1000.0,
-                aircraft.speed.z() * elapsed_time / 1000.0)
-            aircraft.distance_covered = dist(old_pos.toTuple(), aircraft.position.toTuple())
+            speed : QVector3D = aircraft.speed
+            dx, dy, dz, distance_covered = compute_position_step(speed.x(), speed.y(), speed.z(), elapsed_time)
+            aircraft.move(dx, dy, dz)
+            aircraft.distance_covered = distance_covered
         return False
     
     def update_aircrafts_speed_angles(self, elapsed_time : float) -> None:
@@ -139,7 +145,7 @@ class SimulationPhysics(QThread):
             try:
                 fcc : AircraftFCC = self.aircraft_fccs[aircraft_id]
             except IndexError:
-                logging.error("Aircraft's " + str(aircraft_id) + " flight control computer not found")
+                logging.error("Aircraft's %s flight control computer not found", aircraft_id)
                 return
             cause_collision = self.simulation_state.first_cause_collision if aircraft_id == 0 else self.simulation_state.second_cause_collision
             fcc.update() if not cause_collision else fcc.update_target(self.aircraft_vehicles[1 - aircraft_id].position + self.aircraft_vehicles[1 - aircraft_id].speed)
@@ -150,13 +156,8 @@ class SimulationPhysics(QThread):
             speed_difference = abs(current_speed - target_speed)
             max_speed_delta = aircraft.max_acceleration / elapsed_time
             if speed_difference > 0.001 and current_speed - max_speed_delta > 20.0 and current_speed + max_speed_delta < 340: # make drone subsonic
-                
-                if speed_difference < max_speed_delta:
-                    pass # become target
-                elif current_speed < target_speed:
-                    target_speed = current_speed + max_speed_delta
-                else:
-                    target_speed = current_speed - max_speed_delta
+                if speed_difference >= max_speed_delta: # otherwise become target
+                    target_speed = current_speed + copysign(max_speed_delta, target_speed - current_speed)
                 speed_scale_factor : float = target_speed / current_speed
                 aircraft.speed = QVector3D(
                     aircraft.speed.x() * speed_scale_factor,
@@ -168,7 +169,7 @@ class SimulationPhysics(QThread):
 
             # pitch angle
             current_pitch_angle : float = aircraft.pitch_angle
-            target_pitch_angle : float = copy(fcc.target_pitch_angle)
+            target_pitch_angle : float = fcc.target_pitch_angle
             if not abs(current_pitch_angle - target_pitch_angle) < 0.001 and current_pitch_angle < 90.0 and current_pitch_angle > -90.0:
                 delta_pitch_angle : float = (1.0 / (aircraft.pitch_dynamic_delay / elapsed_time)) * (target_pitch_angle - aircraft.pitch_angle)
                 delta_pitch_angle = abs(delta_pitch_angle) # temporary
@@ -203,9 +204,11 @@ class SimulationPhysics(QThread):
 
                 new_yaw_angle : float = 0.0
                 new_yaw_angle = current_yaw_angle + delta_yaw_angle
+                new_yaw_radians : float = radians(new_yaw_angle)
 
-                aircraft.speed.setX(sin(radians(new_yaw_angle)) * current_horizontal_speed)
-                aircraft.speed.setY(-cos(radians(new_yaw_angle)) * current_horizontal_speed)
+                speed : QVector3D = aircraft.speed
+                speed.setX(sin(new_yaw_radians) * current_horizontal_speed)
+                speed.setY(-cos(new_yaw_radians) * current_horizontal_speed)
 
     def test_speed(self) -> None:
         """Tests speed"""
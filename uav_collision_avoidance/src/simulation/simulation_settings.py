@@ -2,17 +2,21 @@
 
 from PySide6.QtCore import QSize
 
+DEFAULT_SIMULATION_FREQUENCY : float = 100.0 # Hz
+DEFAULT_GUI_RENDER_FREQUENCY : float = 100.0 # Hz, fps
+DEFAULT_ADSB_THRESHOLD : float = 1000.0
+
 class SimulationSettings:
     """Settings for the simulation"""
 
     screen_resolution : QSize | None = None
     resolution : tuple
     g_acceleration : float = 9.81
-    simulation_frequency : float = 100.0 # Hz
+    simulation_frequency : float = DEFAULT_SIMULATION_FREQUENCY
     simulation_threshold : float = 1000.0 / simulation_frequency
-    gui_render_frequency : float = 100.0 # Hz, fps
+    gui_render_frequency : float = DEFAULT_GUI_RENDER_FREQUENCY
     gui_render_threshold : float =  1000.0 / gui_render_frequency
-    adsb_threshold : float = 1000.0
+    adsb_threshold : float = DEFAULT_ADSB_THRESHOLD
 
     @classmethod
     def __init__(cls) -> None:
@@ -20,6 +24,14 @@ class SimulationSettings:
         if cls.screen_resolution is not None:
             cls.resolution = (int(cls.screen_resolution.width() * 0.6), int(cls.screen_resolution.height() * 0.75))
 
+    @classmethod
+    def reset(cls) -> None:
+        """Restores default frequencies and thresholds"""
+        cls.set_simulation_frequency(DEFAULT_SIMULATION_FREQUENCY)
+        cls.gui_render_frequency = DEFAULT_GUI_RENDER_FREQUENCY
+        cls.gui_render_threshold = 1000.0 / DEFAULT_GUI_RENDER_FREQUENCY
+        cls.adsb_threshold = DEFAULT_ADSB_THRESHOLD
+
     @classmethod
     def set_simulation_frequency(cls, frequency : float) -> None:
         """Sets the simulation frequency"""
@@ -1,6 +1,5 @@
 """Simulation widget for the main window of the simulation app"""
 
-from copy import copy
 from math import cos, radians, sqrt, degrees, atan2, dist
 from typing import List
 
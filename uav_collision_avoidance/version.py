@@ -1,12 +1,3 @@
 """Contains the version of the package"""
 
-import toml
-
-def get_version():
-    try:
-        pyproject = toml.load("pyproject.toml")
-        return pyproject["project"]["version"]
-    except:
-        return ""
-
-__version__ = get_version()
+__version__ = "1.0.0"